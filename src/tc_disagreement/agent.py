@@ -1,5 +1,5 @@
 from typing import Any, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, PrivateAttr
 import os
 import httpx
 import argparse
@@ -23,6 +23,16 @@ class GetAccessToGemini(BaseModel):
         "gemini-2.5-flash",
     ]
 
+    # One connection pool per agent, created on first request and reused so
+    # repeated prompts don't each pay for a new TLS handshake
+    _client: Optional[httpx.Client] = PrivateAttr(default=None)
+
+    def get_client(self) -> httpx.Client:
+        """Return the agent's HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.Client()
+        return self._client
+
     def setup(
         self,
         model: Optional[str] = None,
@@ -59,7 +69,9 @@ class GetAccessToGemini(BaseModel):
         payload = {"contents": [{"parts": [{"text": prompt}]}]}
 
         try:
-            resp = httpx.post(url, headers=headers, json=payload, timeout=self.timeout)
+            resp = self.get_client().post(
+                url, headers=headers, json=payload, timeout=self.timeout
+            )
             resp.raise_for_status()
             data = resp.json()
 
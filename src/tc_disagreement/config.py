@@ -1,6 +1,24 @@
-BASE_GEN_DIR = "generated_examples"
+import os
+from typing import Final
 
-CHECKERS = {
+BASE_GEN_DIR: Final = "generated_examples"
+
+# Checker outputs keyed by content hash, reused across `check` runs
+CHECKER_CACHE_DIR: Final = os.path.join(
+    os.path.expanduser("~"), ".cache", "pytifex", "checker_results"
+)
+
+# Config files the checkers pick up from the working directory
+CHECKER_CONFIG_FILES: Final = (
+    "mypy.ini",
+    ".mypy.ini",
+    "setup.cfg",
+    "pyproject.toml",
+    "pyrefly.toml",
+    "ty.toml",
+)
+
+CHECKERS: Final[dict[str, list[str]]] = {
     "mypy": ["mypy"],
     "pyrefly": ["pyrefly", "check"],
     "zuban": ["zuban", "check"],
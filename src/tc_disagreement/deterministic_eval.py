@@ -22,17 +22,23 @@ import ast
 import sys
 import re
 import os
+import io
 import json
+import tempfile
+import contextlib
 import importlib.util
 import traceback
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
 import httpx
 
+from testing_eval import NOTREQUIRED_KEY_PATTERN, example_globals, runtime_reveal_type
 
-@dataclass
+
+@dataclass(slots=True)
 class TypeAnnotation:
     """Represents a type annotation found in the AST."""
     line: int
@@ -41,7 +47,7 @@ class TypeAnnotation:
     context: str  # "parameter", "return", "variable", "attribute"
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeTypeError:
     """A type error caught at runtime."""
     line: int
@@ -50,7 +56,7 @@ class RuntimeTypeError:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticCheckerError:
     """An error reported by a static type checker."""
     line: int
@@ -58,7 +64,7 @@ class StaticCheckerError:
     checker: str
 
 
-@dataclass 
+@dataclass(slots=True)
 class GroundTruth:
     """Ground truth for a single line."""
     line: int
@@ -68,7 +74,7 @@ class GroundTruth:
     details: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Complete evaluation result for a file."""
     filename: str
@@ -77,7 +83,7 @@ class EvaluationResult:
     checker_results: dict[str, dict]  # {checker: {precision, recall, f1, tp, fp, fn, tn}}
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMVerdict:
     """LLM's verdict on a type checker's correctness."""
     checker: str
@@ -117,6 +123,12 @@ Respond with ONLY this JSON (no other text):
 '''
 
 
+@lru_cache(maxsize=None)
+def get_gemini_client() -> httpx.Client:
+    """Shared Gemini HTTP client, so per-file calls reuse one connection."""
+    return httpx.Client(timeout=120.0)
+
+
 def call_gemini_api(prompt: str, model: str = "gemini-2.5-flash") -> str:
     """Call Gemini API and return the response text."""
     token = os.environ.get("GEMINI_API_KEY")
@@ -127,7 +139,7 @@ def call_gemini_api(prompt: str, model: str = "gemini-2.5-flash") -> str:
     headers = {"Content-Type": "application/json", "x-goog-api-key": token}
     payload = {"contents": [{"parts": [{"text": prompt}]}]}
     
-    resp = httpx.post(url, headers=headers, json=payload, timeout=120.0)
+    resp = get_gemini_client().post(url, headers=headers, json=payload)
     resp.raise_for_status()
     data = resp.json()
     
@@ -148,11 +160,12 @@ def evaluate_with_llm(
     Returns {checker_name: LLMVerdict}.
     """
     # Format checker outputs concisely
-    checker_outputs_str = ""
+    parts = []
     for checker, output in checker_outputs.items():
         # Truncate long outputs
         truncated = output[:500] + "..." if len(output) > 500 else output
-        checker_outputs_str += f"{checker}: {truncated}\n\n"
+        parts.append(f"{checker}: {truncated}\n\n")
+    checker_outputs_str = "".join(parts)
     
     # Truncate code if too long
     code = source_code[:3000] + "\n# ... (truncated)" if len(source_code) > 3000 else source_code
@@ -228,6 +241,13 @@ def evaluate_with_llm(
 class ASTAnalyzer(ast.NodeVisitor):
     """Extract type annotations and potential type errors from AST."""
     
+    LITERAL_NODE_TYPES = {
+        ast.List: "list",
+        ast.Dict: "dict",
+        ast.Set: "set",
+        ast.Tuple: "tuple",
+    }
+    
     def __init__(self):
         self.annotations: list[TypeAnnotation] = []
         self.potential_errors: list[tuple[int, str]] = []  # (line, reason)
@@ -295,16 +315,13 @@ class ASTAnalyzer(ast.NodeVisitor):
         
     def _infer_type(self, node: ast.expr) -> Optional[str]:
         """Try to infer the type of an expression."""
+        # Parser-produced nodes are exact AST classes, so a type lookup
+        # replaces the isinstance chain for the container displays
+        literal_type = self.LITERAL_NODE_TYPES.get(type(node))
+        if literal_type is not None:
+            return literal_type
         if isinstance(node, ast.Constant):
             return type(node.value).__name__
-        elif isinstance(node, ast.List):
-            return "list"
-        elif isinstance(node, ast.Dict):
-            return "dict"
-        elif isinstance(node, ast.Set):
-            return "set"
-        elif isinstance(node, ast.Tuple):
-            return "tuple"
         elif isinstance(node, ast.Name):
             return node.id  # Variable name, might be a type
         elif isinstance(node, ast.Call):
@@ -369,9 +386,6 @@ def run_with_beartype(source_code: str, filename: str) -> list[RuntimeTypeError]
         return errors
     
     # Write to temp file and import
-    import tempfile
-    import os
-    
     temp_dir = tempfile.mkdtemp()
     temp_file = os.path.join(temp_dir, "temp_module.py")
     
@@ -395,6 +409,7 @@ from beartype.roar import BeartypeCallHintViolation
         spec = importlib.util.spec_from_file_location("temp_module", temp_file)
         if spec and spec.loader:
             module = importlib.util.module_from_spec(spec)
+            module.reveal_type = runtime_reveal_type
             try:
                 spec.loader.exec_module(module)
             except Exception as e:
@@ -432,7 +447,7 @@ from beartype.roar import BeartypeCallHintViolation
     return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpectedTypeError:
     """A type error that the code expects (via try/except)."""
     try_line: int  # Line where try block starts
@@ -521,15 +536,9 @@ def find_typeddict_unsafe_access(source_code: str) -> list[tuple[int, str]]:
         tree = ast.parse(source_code)
         
         # Find TypedDict definitions and their NotRequired fields
-        # This is a simplified check - look for NotRequired in the source
-        notrequired_keys = set()
-        for line in source_code.splitlines():
-            if 'NotRequired[' in line:
-                # Try to extract the key name
-                import re
-                match = re.search(r'(\w+)\s*:\s*NotRequired\[', line)
-                if match:
-                    notrequired_keys.add(match.group(1))
+        # This is a simplified check - look for NotRequired in the source,
+        # collecting the optional keys once in a single scan
+        notrequired_keys = set(NOTREQUIRED_KEY_PATTERN.findall(source_code))
         
         # Find subscript accesses
         class SubscriptVisitor(ast.NodeVisitor):
@@ -557,7 +566,9 @@ def run_with_tracing(source_code: str) -> tuple[list[RuntimeTypeError], float]:
     errors: list[RuntimeTypeError] = []
     caught_errors: list[RuntimeTypeError] = []
     executed_lines: set[int] = set()
-    total_lines = len([l for l in source_code.splitlines() if l.strip() and not l.strip().startswith("#")])
+    total_lines = sum(
+        1 for l in source_code.splitlines() if l.strip() and not l.lstrip().startswith("#")
+    )
     
     # First, find expected errors from try/except blocks
     expected_errors = find_expected_type_errors(source_code)
@@ -582,17 +593,27 @@ def run_with_tracing(source_code: str) -> tuple[list[RuntimeTypeError], float]:
             message=f"Access to NotRequired key '{key}' without existence check"
         ))
     
-    def trace_calls(frame, event, arg):
+    record_line = executed_lines.add
+    
+    def trace_lines(frame, event, arg):
         if event == 'line':
-            executed_lines.add(frame.f_lineno)
-        return trace_calls
+            record_line(frame.f_lineno)
+        return trace_lines
+    
+    def trace_calls(frame, event, arg):
+        # Only line-trace the executed source; library frames (and code that
+        # dataclasses/namedtuple exec as "<string>") would both slow execution
+        # down and add their line numbers to the coverage set
+        if frame.f_code.co_filename == "<traced>":
+            return trace_lines
+        return None
     
     # Execute with tracing
     try:
         old_trace = sys.gettrace()
         sys.settrace(trace_calls)
         
-        exec(compile(source_code, "<string>", "exec"), {"__name__": "__main__"})
+        exec(compile(source_code, "<traced>", "exec"), example_globals())
         
     except TypeError as e:
         tb = traceback.extract_tb(sys.exc_info()[2])
@@ -633,26 +654,29 @@ def run_with_tracing(source_code: str) -> tuple[list[RuntimeTypeError], float]:
     return all_errors, coverage
 
 
-def parse_checker_errors(checker_output: str, checker_name: str) -> list[StaticCheckerError]:
-    """Parse error lines from a type checker's output."""
-    errors = []
-    
-    # Common patterns for error lines
-    # mypy: file.py:10: error: message
-    # pyrefly: --> file.py:10:5
-    # zuban: file.py:10: error: message  
-    # ty: --> file.py:10:5
-    
-    patterns = [
+# Common patterns for error lines, tried in order
+# mypy: file.py:10: error: message
+# pyrefly: --> file.py:10:5
+# zuban: file.py:10: error: message  
+# ty: --> file.py:10:5
+CHECKER_ERROR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r":(\d+):\s*error:",  # mypy/zuban style
         r":(\d+):\s*Error",   # pyrefly style
         r"--> .*?:(\d+):",    # ty/pyrefly arrow style
         r"line (\d+)",        # generic
-    ]
+    )
+)
+
+
+def parse_checker_errors(checker_output: str, checker_name: str) -> list[StaticCheckerError]:
+    """Parse error lines from a type checker's output."""
+    errors = []
     
     for line in checker_output.splitlines():
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in CHECKER_ERROR_PATTERNS:
+            match = pattern.search(line)
             if match:
                 line_num = int(match.group(1))
                 errors.append(StaticCheckerError(
@@ -665,35 +689,6 @@ def parse_checker_errors(checker_output: str, checker_name: str) -> list[StaticC
     return errors
 
 
-def compute_checker_consensus(checker_errors: dict[str, list[StaticCheckerError]]) -> dict[int, str]:
-    """
-    Compute consensus across checkers for each line.
-    Returns {line: "error" | "ok" | "split"}
-    """
-    # Collect all lines mentioned
-    all_lines: set[int] = set()
-    for errors in checker_errors.values():
-        for err in errors:
-            all_lines.add(err.line)
-    
-    consensus = {}
-    for line in all_lines:
-        error_count = sum(
-            1 for checker, errors in checker_errors.items()
-            if any(e.line == line for e in errors)
-        )
-        total_checkers = len(checker_errors)
-        
-        if error_count >= total_checkers * 0.75:  # 3/4 or more
-            consensus[line] = "error"
-        elif error_count <= total_checkers * 0.25:  # 1/4 or less
-            consensus[line] = "ok"
-        else:
-            consensus[line] = "split"
-    
-    return consensus
-
-
 def establish_ground_truth(
     source_code: str,
     checker_outputs: dict[str, str],
@@ -722,12 +717,6 @@ def establish_ground_truth(
     ast_errors = extract_potential_errors(source_code)
     ast_error_dict = {line: reason for line, reason in ast_errors}
     
-    # Checker errors (for reference only, NOT for establishing ground truth)
-    checker_errors = {
-        name: parse_checker_errors(output, name)
-        for name, output in checker_outputs.items()
-    }
-    
     # Collect all lines where we have evidence
     all_error_lines = set()
     all_error_lines.update(runtime_error_lines.keys())
@@ -884,9 +873,6 @@ def evaluate_results_deterministic(results_path: str) -> dict:
     """
     Main entry point: evaluate all files in a results.json deterministically.
     """
-    import json
-    import os
-    
     with open(results_path) as f:
         data = json.load(f)
     
@@ -917,9 +903,6 @@ def evaluate_results_deterministic(results_path: str) -> dict:
             continue
         
         # Evaluate (suppress runtime output during evaluation)
-        import io
-        import contextlib
-        
         with contextlib.redirect_stdout(io.StringIO()):
             result = evaluate_file(source_code, filename, outputs)
         
@@ -1043,15 +1026,12 @@ def evaluate_results_deterministic(results_path: str) -> dict:
 
 def execute_and_capture(source_code: str) -> str:
     """Execute code and capture any runtime errors."""
-    import io
-    import contextlib
-    
     output = io.StringIO()
     error_output = ""
     
     try:
         with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
-            exec(compile(source_code, "<string>", "exec"), {"__name__": "__main__"})
+            exec(compile(source_code, "<string>", "exec"), example_globals())
     except TypeError as e:
         error_output = f"TypeError: {e}"
     except KeyError as e:
@@ -1195,8 +1175,6 @@ def evaluate_results_llm(results_path: str, model: str = "gemini-2.5-flash") ->
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python deterministic_eval.py <results.json> [--llm] [--model MODEL]")
         print("  --llm          Use LLM-based evaluation (recommended, requires GEMINI_API_KEY)")
@@ -19,6 +19,7 @@ import time
 import random
 import textwrap
 import argparse
+from functools import lru_cache
 
 from config import BASE_GEN_DIR
 
@@ -179,16 +180,21 @@ def get_latest_results_file() -> Optional[str]:
     return results_path if os.path.exists(results_path) else None
 
 
-def print_wrapped(text: str, indent: str = "  ", width: int = 100):
-    """Print text with word wrapping and indentation."""
-    wrapper = textwrap.TextWrapper(
+@lru_cache(maxsize=None)
+def get_text_wrapper(indent: str, width: int) -> textwrap.TextWrapper:
+    """Build a TextWrapper once per (indent, width); it holds no per-call state."""
+    return textwrap.TextWrapper(
         width=width,
         initial_indent=indent,
         subsequent_indent=indent,
         break_long_words=False,
         break_on_hyphens=False,
     )
-    print(wrapper.fill(text))
+
+
+def print_wrapped(text: str, indent: str = "  ", width: int = 100):
+    """Print text with word wrapping and indentation."""
+    print(get_text_wrapper(indent, width).fill(text))
 
 
 def call_agent_with_retry(agent, prompt: str, max_retries: int = 5) -> Optional[str]:
@@ -213,13 +219,31 @@ def call_agent_with_retry(agent, prompt: str, max_retries: int = 5) -> Optional[
     return None
 
 
+def analyze_code(agent, source_code: str) -> Optional[str]:
+    """Step 1 of multi-step evaluation. Depends only on the source, not the tool."""
+    return call_agent_with_retry(agent, STEP1_ANALYZE_CODE.format(source_code=source_code))
+
+
+def analyze_runtime(agent, source_code: str) -> Optional[str]:
+    """Runtime-validation analysis. Depends only on the source, not the tool."""
+    return call_agent_with_retry(
+        agent, RUNTIME_VALIDATION_PROMPT.format(source_code=source_code)
+    )
+
+
 def multi_step_evaluation(
-    agent, source_code: str, tool_name: str, tool_output: str
+    agent,
+    source_code: str,
+    tool_name: str,
+    tool_output: str,
+    analysis: Optional[str],
 ) -> dict:
-    """Two-step evaluation: analyze code, then compare checker output."""
-    analysis_prompt = STEP1_ANALYZE_CODE.format(source_code=source_code)
-    analysis = call_agent_with_retry(agent, analysis_prompt)
+    """
+    Two-step evaluation: analyze code, then compare checker output.
 
+    `analysis` is the analyze_code() result for the file (None if it failed),
+    shared across all checkers of that file.
+    """
     if not analysis:
         return {
             "verdict": "ERROR",
@@ -279,15 +303,13 @@ def consensus_evaluation(
 
     results: dict[str, dict] = {}
     current_tool = None
+    # The model may echo tool names in any case; map them back to our keys
+    tool_names = {tool.lower(): tool for tool in all_outputs}
 
     for line in response.splitlines():
         if line.startswith("TOOL:"):
             current_tool = line.replace("TOOL:", "").strip().lower()
-            if current_tool not in all_outputs:
-                for key in all_outputs.keys():
-                    if key.lower() == current_tool:
-                        current_tool = key
-                        break
+            current_tool = tool_names.get(current_tool, current_tool)
             if current_tool:
                 results[current_tool] = {"method": "consensus"}
         elif current_tool and line.startswith("LIKELY_CORRECT:"):
@@ -311,12 +333,18 @@ def consensus_evaluation(
 
 
 def runtime_evaluation(
-    agent, source_code: str, tool_name: str, tool_output: str
+    agent,
+    source_code: str,
+    tool_name: str,
+    tool_output: str,
+    response: Optional[str],
 ) -> dict:
-    """Evaluate by checking if code would have runtime errors."""
-    prompt = RUNTIME_VALIDATION_PROMPT.format(source_code=source_code)
-    response = call_agent_with_retry(agent, prompt)
+    """
+    Evaluate by checking if code would have runtime errors.
 
+    `response` is the analyze_runtime() result for the file (None if it
+    failed), shared across all checkers of that file.
+    """
     if not response:
         return {
             "verdict": "ERROR",
@@ -443,6 +471,17 @@ def evaluate_results(
                     file_results["evaluations"][tool].append(eval_result)
 
         if method in ["multi_step", "runtime", "all"]:
+            # The analysis prompts only contain the source code, so ask once
+            # per file and compare every checker against the same answer.
+            code_analysis = None
+            runtime_analysis = None
+            if method in ["multi_step", "all"]:
+                print("\n[Analyzing code]")
+                code_analysis = analyze_code(agent, source_code)
+            if method in ["runtime", "all"]:
+                print("\n[Analyzing runtime behavior]")
+                runtime_analysis = analyze_runtime(agent, source_code)
+
             for tool, output in file_entry["outputs"].items():
                 print(f"\n[{tool}]")
 
@@ -451,7 +490,9 @@ def evaluate_results(
 
                 if method in ["multi_step", "all"]:
                     print("  Running multi-step analysis...")
-                    result = multi_step_evaluation(agent, source_code, tool, output)
+                    result = multi_step_evaluation(
+                        agent, source_code, tool, output, analysis=code_analysis
+                    )
 
                     verdict = result.get("verdict", "UNKNOWN")
                     reason = result.get("reason", "No reason provided")
@@ -465,7 +506,9 @@ def evaluate_results(
 
                 if method in ["runtime", "all"]:
                     print("  Running runtime validation...")
-                    result = runtime_evaluation(agent, source_code, tool, output)
+                    result = runtime_evaluation(
+                        agent, source_code, tool, output, response=runtime_analysis
+                    )
 
                     verdict = result.get("verdict", "UNKNOWN")
                     reason = result.get("reason", "No reason provided")
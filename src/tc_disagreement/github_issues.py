@@ -5,13 +5,17 @@ Extracts code examples from closed issues (especially false positives/negatives)
 
 import os
 import re
+import json
+import base64
 import random
+import urllib.parse
 import httpx
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueExample:
     repo: str
     issue_number: int
@@ -72,10 +76,6 @@ def extract_pyrefly_sandbox_code(text: str) -> list[str]:
     
     The project parameter contains base64-encoded JSON with the code.
     """
-    import base64
-    import json
-    import urllib.parse
-    
     codes = []
     
     # Find pyrefly sandbox URLs
@@ -148,6 +148,24 @@ def extract_python_code(text: str) -> list[str]:
     return result
 
 
+@lru_cache(maxsize=None)
+def get_github_client() -> httpx.Client:
+    """
+    Shared GitHub API client, created on first use.
+    
+    Reusing one client keeps the TLS connection to api.github.com alive across
+    the many issue/page requests of a run and builds the auth headers once.
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return httpx.Client(headers=headers, timeout=30)
+
+
 def fetch_issues(
     repo: str,
     labels: list[str] | None = None,
@@ -156,14 +174,7 @@ def fetch_issues(
     max_pages: int = 3,
 ) -> list[dict]:
     """Fetch issues from a GitHub repository."""
-    token = os.environ.get("GITHUB_TOKEN")
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    
+    client = get_github_client()
     all_issues = []
     
     for page in range(1, max_pages + 1):
@@ -179,7 +190,7 @@ def fetch_issues(
             params["labels"] = ",".join(labels)
         
         try:
-            resp = httpx.get(url, headers=headers, params=params, timeout=30)
+            resp = client.get(url, params=params)
             resp.raise_for_status()
             issues = resp.json()
             
@@ -196,18 +207,10 @@ def fetch_issues(
 
 def get_issue_body(repo: str, issue_number: int) -> str:
     """Fetch the full body of a specific issue."""
-    token = os.environ.get("GITHUB_TOKEN")
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    
     url = f"https://api.github.com/repos/{repo}/issues/{issue_number}"
     
     try:
-        resp = httpx.get(url, headers=headers, timeout=30)
+        resp = get_github_client().get(url)
         resp.raise_for_status()
         return resp.json().get("body", "")
     except Exception:
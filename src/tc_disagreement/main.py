@@ -24,8 +24,63 @@ import argparse
 import sys
 
 from run_checkers import run_checkers
-from eval import evaluate_results
-from pipeline import generate_with_filtering
+
+
+# Evaluators are imported inside their runner so a run only loads the
+# evaluation method (and its dependencies) it actually uses.
+def run_tiered_eval(results_path: str, args) -> str:
+    """Level 1-3: runtime, coverage, mutation."""
+    from tiered_eval import evaluate_results_tiered
+    evaluate_results_tiered(results_path, max_level=args.max_level)
+    return results_path.replace("results.json", "evaluation_tiered.json")
+
+
+def run_testing_eval(results_path: str, args) -> str:
+    """Hypothesis + beartype."""
+    from testing_eval import evaluate_results_testing
+    evaluate_results_testing(results_path)
+    return results_path.replace("results.json", "evaluation_testing.json")
+
+
+def run_llm_judge_eval(results_path: str, args) -> str:
+    """Single structured LLM verdict per file."""
+    from deterministic_eval import evaluate_results_llm
+    evaluate_results_llm(results_path, model=args.model)
+    return results_path.replace("results.json", "evaluation_llm.json")
+
+
+def run_deterministic_eval(results_path: str, args) -> str:
+    """AST + runtime, no LLM (less accurate)."""
+    from deterministic_eval import evaluate_results_deterministic
+    evaluate_results_deterministic(results_path)
+    return results_path.replace("results.json", "evaluation_deterministic.json")
+
+
+def run_prompt_eval(results_path: str, args) -> str:
+    """multi_step / consensus / runtime / all prompt-based methods."""
+    from eval import evaluate_results
+    return evaluate_results(results_path, method=args.eval_method, verbose=args.verbose)
+
+
+EVAL_METHODS = {
+    "multi_step": run_prompt_eval,
+    "consensus": run_prompt_eval,
+    "runtime": run_prompt_eval,
+    "all": run_prompt_eval,
+    "deterministic": run_deterministic_eval,
+    "llm": run_llm_judge_eval,
+    "testing": run_testing_eval,
+    "tiered": run_tiered_eval,
+}
+
+
+def run_evaluation(results_path: str, args) -> str:
+    """Run the selected evaluation method. Returns the evaluation output path."""
+    try:
+        evaluate = EVAL_METHODS[args.eval_method]
+    except KeyError:
+        raise ValueError(f"Unknown evaluation method: {args.eval_method}") from None
+    return evaluate(results_path, args)
 
 
 def main():
@@ -91,7 +146,7 @@ Options:
     )
     parser.add_argument(
         "--eval-method",
-        choices=["multi_step", "consensus", "runtime", "all", "deterministic", "llm", "testing", "tiered"],
+        choices=list(EVAL_METHODS),
         default="tiered",
         help="Evaluation method (default: tiered = multi-level runtime/coverage/mutation testing)",
     )
@@ -102,6 +157,14 @@ Options:
         choices=[1, 2, 3],
         help="Maximum evaluation level for tiered method (default: 3)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Re-run type checkers instead of reusing cached results (check command); "
+            "needed after changing installed stubs or checker plugins"
+        ),
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Verbose output"
     )
@@ -110,6 +173,7 @@ Options:
 
     try:
         if args.command == "full":
+            from pipeline import generate_with_filtering
             print("=" * 60)
             print("PYTIFEX - Full Pipeline (with disagreement filtering)")
             print("=" * 60)
@@ -131,32 +195,7 @@ Options:
 
             print(f"\n[STEP 2/2] Evaluating {len(disagreements)} disagreements...")
             results_path = f"{base_path}/results.json"
-            
-            if args.eval_method == "tiered":
-                # Use tiered evaluation (Level 1-3: runtime, coverage, mutation)
-                from tiered_eval import evaluate_results_tiered
-                evaluate_results_tiered(results_path, max_level=args.max_level)
-                eval_path = f"{base_path}/evaluation_tiered.json"
-            elif args.eval_method == "testing":
-                # Use testing-based evaluation (Hypothesis + beartype)
-                from testing_eval import evaluate_results_testing
-                evaluate_results_testing(results_path)
-                eval_path = f"{base_path}/evaluation_testing.json"
-            elif args.eval_method == "llm":
-                # Use LLM-based evaluation
-                from deterministic_eval import evaluate_results_llm
-                evaluate_results_llm(results_path, model=args.model)
-                eval_path = f"{base_path}/evaluation_llm.json"
-            elif args.eval_method == "deterministic":
-                # Use deterministic evaluation (no LLM, less accurate)
-                from deterministic_eval import evaluate_results_deterministic
-                evaluate_results_deterministic(results_path)
-                eval_path = f"{base_path}/evaluation_deterministic.json"
-            else:
-                # Use LLM-based evaluation
-                eval_path = evaluate_results(
-                    results_path, method=args.eval_method, verbose=args.verbose
-                )
+            eval_path = run_evaluation(results_path, args)
 
             print("\n" + "=" * 60)
             print("PIPELINE COMPLETE")
@@ -166,6 +205,7 @@ Options:
             print(f"Evaluation: {eval_path}")
 
         elif args.command == "generate":
+            from pipeline import generate_with_filtering
             disagreements, base_path = generate_with_filtering(
                 model=args.model,
                 target_count=args.num_examples,
@@ -178,7 +218,7 @@ Options:
             print(f"\n[SUCCESS] {len(disagreements)} disagreements saved to: {base_path}")
 
         elif args.command == "check":
-            results_path = run_checkers()
+            results_path = run_checkers(use_cache=not args.no_cache)
             print(f"\n[SUCCESS] Results saved to: {results_path}")
 
         elif args.command == "eval":
@@ -190,27 +230,7 @@ Options:
                 print("[ERROR] No results.json found. Run 'generate' first.")
                 sys.exit(1)
             results_path = results_files[-1]
-            
-            if args.eval_method == "tiered":
-                from tiered_eval import evaluate_results_tiered
-                evaluate_results_tiered(results_path, max_level=args.max_level)
-                eval_path = results_path.replace("results.json", "evaluation_tiered.json")
-            elif args.eval_method == "testing":
-                from testing_eval import evaluate_results_testing
-                evaluate_results_testing(results_path)
-                eval_path = results_path.replace("results.json", "evaluation_testing.json")
-            elif args.eval_method == "llm":
-                from deterministic_eval import evaluate_results_llm
-                evaluate_results_llm(results_path, model=args.model)
-                eval_path = results_path.replace("results.json", "evaluation_llm.json")
-            elif args.eval_method == "deterministic":
-                from deterministic_eval import evaluate_results_deterministic
-                evaluate_results_deterministic(results_path)
-                eval_path = results_path.replace("results.json", "evaluation_deterministic.json")
-            else:
-                eval_path = evaluate_results(
-                    results_path, method=args.eval_method, verbose=args.verbose
-                )
+            eval_path = run_evaluation(results_path, args)
             print(f"\n[SUCCESS] Evaluation saved to: {eval_path}")
 
     except ValueError as e:
@@ -7,7 +7,10 @@ use them as seeds, and generate variations that might cause divergences.
 
 import os
 import re
+import json
+import datetime
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -20,13 +23,13 @@ from github_issues import fetch_random_examples, IssueExample
 import generate_json
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckerResult:
     status: str  # "ok" or "error"
     output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Example:
     id: str
     code: str
@@ -51,15 +54,19 @@ def extract_seed_issue(metadata: str) -> str | None:
     return None
 
 
-def run_checker_on_code(code: str, checker_name: str, command: list[str]) -> CheckerResult:
-    """Run a single type checker on code and return the result."""
+def write_temp_source(code: str) -> str:
+    """Write code to a temp file for the checkers and return its path."""
     # Use current directory for temp files - zuban doesn't work with /tmp/ paths
     temp_filename = f"_pytifex_temp_{os.getpid()}.py"
     temp_path = os.path.join(os.getcwd(), temp_filename)
     
     with open(temp_path, "w") as f:
         f.write(code)
+    return temp_path
 
+
+def run_checker_on_file(temp_path: str, command: list[str]) -> CheckerResult:
+    """Run a single type checker on a file and return the result."""
     try:
         result = subprocess.run(
             command + [temp_path],
@@ -85,16 +92,25 @@ def run_checker_on_code(code: str, checker_name: str, command: list[str]) -> Che
         return CheckerResult(status="error", output="Timeout")
     except Exception as e:
         return CheckerResult(status="error", output=str(e))
-    finally:
-        os.unlink(temp_path)
 
 
 def run_all_checkers(code: str) -> dict[str, CheckerResult]:
-    """Run all type checkers on code and return results."""
-    results = {}
-    for name, command in CHECKERS.items():
-        results[name] = run_checker_on_code(code, name, command)
-    return results
+    """
+    Run all type checkers on code and return results.
+    
+    The code is written once and the checkers, which only read it, run
+    concurrently as separate subprocesses.
+    """
+    temp_path = write_temp_source(code)
+    try:
+        with ThreadPoolExecutor(max_workers=len(CHECKERS)) as pool:
+            futures = {
+                name: pool.submit(run_checker_on_file, temp_path, command)
+                for name, command in CHECKERS.items()
+            }
+            return {name: f.result() for name, f in futures.items()}
+    finally:
+        os.unlink(temp_path)
 
 
 def has_disagreement(results: dict[str, CheckerResult]) -> bool:
@@ -274,7 +290,6 @@ def refine_example(
         parsed = generate_json.parse_generated_content(response)
         if not parsed:
             # Try to extract code directly from markdown
-            import re
             match = re.search(r"```python\n(.*?)```", response, re.DOTALL)
             if match:
                 code = match.group(1).strip()
@@ -304,9 +319,6 @@ def save_disagreements(
     model: str,
 ) -> str:
     """Save the disagreement examples to disk."""
-    import datetime
-    import json
-
     now = datetime.datetime.now()
     folder_name = now.strftime("%Y-%m-%d_%H-%M-%S")
     base_path = os.path.join(BASE_GEN_DIR, folder_name)
@@ -1,10 +1,13 @@
 import os
 import json
+import hashlib
 import subprocess
 import sys
 import glob as glob_module
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from config import BASE_GEN_DIR, CHECKERS
+from config import BASE_GEN_DIR, CHECKERS, CHECKER_CACHE_DIR, CHECKER_CONFIG_FILES
 
 
 def get_latest_generation_dir() -> str:
@@ -44,10 +47,109 @@ def run_tool(command: list[str], filepath: str) -> str:
         return f"Execution Error: {str(e)}"
 
 
-def run_checkers(target_dir: str | None = None) -> str:
+@lru_cache(maxsize=None)
+def get_tool_version(executable: str) -> str:
+    """Returns the checker's --version output, so upgrades invalidate the cache."""
+    try:
+        result = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, check=False
+        )
+        return (result.stdout + result.stderr).strip()
+    except OSError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def get_checker_environment() -> bytes:
+    """
+    The Python version plus the checker config files in the working directory.
+    
+    Both change checker output for identical source files, so they are part
+    of every cache key.
+    """
+    parts = [sys.version.encode()]
+    for name in CHECKER_CONFIG_FILES:
+        try:
+            with open(name, "rb") as f:
+                parts.append(name.encode() + b"\0" + f.read())
+        except OSError:
+            continue
+    return b"\0".join(parts)
+
+
+def cache_path_for(command: list[str], filepath: str) -> str:
+    """
+    Cache file for one (checker, file) result.
+    
+    The key covers the checker version and command line, the Python version,
+    the checker config files in the working directory, the file path exactly
+    as passed (it appears in the output) together with the working directory
+    it is relative to, and the file contents. Installed stubs and checker
+    plugins are not covered; use --no-cache after changing them.
+    """
+    digest = hashlib.sha256()
+    digest.update(get_tool_version(command[0]).encode())
+    digest.update(get_checker_environment())
+    digest.update("\0".join(command).encode())
+    digest.update(b"\0" + os.getcwd().encode() + b"\0" + filepath.encode() + b"\0")
+    with open(filepath, "rb") as f:
+        digest.update(f.read())
+    return os.path.join(CHECKER_CACHE_DIR, f"{digest.hexdigest()}.txt")
+
+
+def run_tool_cached(command: list[str], filepath: str) -> str:
+    """
+    Runs a checker on a file, reusing a cached output for identical input.
+    
+    The cache is best effort: if it can't be read or written (e.g. a missing
+    or read-only ~/.cache), the checker output is returned uncached.
+    """
+    try:
+        cache_path = cache_path_for(command, filepath)
+    except OSError:
+        return run_tool(command, filepath)
+
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    output = run_tool(command, filepath)
+
+    # Don't remember failures to launch the checker
+    if not output.startswith(("Error: Command", "Execution Error:")):
+        try:
+            os.makedirs(CHECKER_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(output)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    return output
+
+
+def run_tool_on_files(
+    tool_name: str, command: list[str], py_files: list[str], use_cache: bool = True
+) -> list[str]:
+    """Runs one type checker over every file, in order."""
+    run = run_tool_cached if use_cache else run_tool
+    outputs = [run(command, filepath) for filepath in py_files]
+    print(f"  {tool_name}: done")
+    return outputs
+
+
+def run_checkers(target_dir: str | None = None, use_cache: bool = True) -> str:
     """
     Run type checkers on Python files in the target directory.
     Returns the path to the results.json file.
+    
+    With use_cache, outputs are read from CHECKER_CACHE_DIR instead of
+    re-running when the checker version and command line, the Python version,
+    the checker config files in the working directory, the file path and the
+    file contents are all unchanged (see cache_path_for).
     """
     if target_dir is None:
         target_dir = get_latest_generation_dir()
@@ -66,18 +168,28 @@ def run_checkers(target_dir: str | None = None) -> str:
     print(f"--- Running Type Checkers on {len(py_files)} files ---")
     print(f"Directory: {target_dir}\n")
 
-    all_results = []
-
-    for filepath in py_files:
-        filename = os.path.basename(filepath)
-        print(f"Checking {filename}...")
+    # The checkers are independent subprocesses, so run them side by side.
+    # Each checker still walks the files one at a time, which keeps a single
+    # process per tool writing to its cache directory (e.g. .mypy_cache).
+    with ThreadPoolExecutor(max_workers=len(CHECKERS)) as pool:
+        futures = {
+            tool_name: pool.submit(
+                run_tool_on_files, tool_name, command, py_files, use_cache
+            )
+            for tool_name, command in CHECKERS.items()
+        }
+        outputs_by_tool = {tool_name: f.result() for tool_name, f in futures.items()}
 
-        file_result = {"filename": filename, "filepath": filepath, "outputs": {}}
-
-        for tool_name, command in CHECKERS.items():
-            output = run_tool(command, filepath)
-            file_result["outputs"][tool_name] = output
+    all_results = []
 
+    for i, filepath in enumerate(py_files):
+        file_result = {
+            "filename": os.path.basename(filepath),
+            "filepath": filepath,
+            "outputs": {
+                tool_name: outputs[i] for tool_name, outputs in outputs_by_tool.items()
+            },
+        }
         all_results.append(file_result)
 
     results_json_path = os.path.join(target_dir, "results.json")
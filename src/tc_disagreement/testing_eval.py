@@ -27,18 +27,22 @@ import traceback
 import io
 import contextlib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional, Callable
 from pathlib import Path
 
 # These are imported at runtime to avoid issues if not installed
 # hypothesis and beartype are installed via uv when running
 
+# `key: NotRequired[...]` field declarations inside a TypedDict body
+NOTREQUIRED_KEY_PATTERN = re.compile(r'(\w+)[ \t]*:[ \t]*NotRequired\[')
+
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TypeBug:
     """A confirmed type-related bug found through testing."""
     line: int
@@ -48,7 +52,7 @@ class TypeBug:
     confidence: float  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionSignature:
     """Extracted function signature with type annotations."""
     name: str
@@ -59,7 +63,7 @@ class FunctionSignature:
     is_async: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of testing a single code example."""
     filename: str
@@ -161,15 +165,8 @@ class NotRequiredAccessAnalyzer(ast.NodeVisitor):
     
     def __init__(self, source_code: str):
         self.source_code = source_code
-        self.notrequired_keys: set[str] = set()
+        self.notrequired_keys: set[str] = set(NOTREQUIRED_KEY_PATTERN.findall(source_code))
         self.unsafe_accesses: list[TypeBug] = []
-        self._find_notrequired_keys()
-    
-    def _find_notrequired_keys(self):
-        """Find all NotRequired field names in the source."""
-        pattern = r'(\w+)\s*:\s*NotRequired\['
-        for match in re.finditer(pattern, self.source_code):
-            self.notrequired_keys.add(match.group(1))
     
     def visit_Subscript(self, node: ast.Subscript):
         """Check for dict[key] access where key is NotRequired."""
@@ -186,37 +183,39 @@ class NotRequiredAccessAnalyzer(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def extract_signatures(source_code: str) -> list[FunctionSignature]:
-    """Extract all function signatures from source code."""
+def parse_source(source_code: str) -> Optional[ast.Module]:
+    """Parse source code once for all the AST analyses, or None on a syntax error."""
     try:
-        tree = ast.parse(source_code)
-        extractor = SignatureExtractor()
-        extractor.visit(tree)
-        return extractor.signatures
+        return ast.parse(source_code)
     except SyntaxError:
+        return None
+
+
+def extract_signatures(tree: Optional[ast.Module]) -> list[FunctionSignature]:
+    """Extract all function signatures from a parsed module."""
+    if tree is None:
         return []
+    extractor = SignatureExtractor()
+    extractor.visit(tree)
+    return extractor.signatures
 
 
-def find_expected_errors(source_code: str) -> list[TypeBug]:
+def find_expected_errors(tree: Optional[ast.Module]) -> list[TypeBug]:
     """Find lines where code expects type errors via try/except."""
-    try:
-        tree = ast.parse(source_code)
-        analyzer = TryExceptAnalyzer()
-        analyzer.visit(tree)
-        return analyzer.expected_errors
-    except SyntaxError:
+    if tree is None:
         return []
+    analyzer = TryExceptAnalyzer()
+    analyzer.visit(tree)
+    return analyzer.expected_errors
 
 
-def find_notrequired_access(source_code: str) -> list[TypeBug]:
+def find_notrequired_access(source_code: str, tree: Optional[ast.Module]) -> list[TypeBug]:
     """Find unsafe access to NotRequired TypedDict fields."""
-    try:
-        tree = ast.parse(source_code)
-        analyzer = NotRequiredAccessAnalyzer(source_code)
-        analyzer.visit(tree)
-        return analyzer.unsafe_accesses
-    except SyntaxError:
+    if tree is None:
         return []
+    analyzer = NotRequiredAccessAnalyzer(source_code)
+    analyzer.visit(tree)
+    return analyzer.unsafe_accesses
 
 
 # =============================================================================
@@ -232,11 +231,14 @@ def get_hypothesis_strategies():
         return None
 
 
+@lru_cache(maxsize=1024)
 def annotation_to_strategy(annotation: str, st):
     """
     Convert a type annotation string to a Hypothesis strategy.
     
     This maps Python type annotations to strategies that generate valid values.
+    The result depends only on the annotation text and strategies are immutable,
+    so it is cached; recursive calls for inner types share the same cache.
     """
     if st is None:
         return None
@@ -366,6 +368,22 @@ def build_strategies_for_function(sig: FunctionSignature, st) -> Optional[dict]:
 # RUNTIME EXECUTION WITH TRACING
 # =============================================================================
 
+def runtime_reveal_type(obj):
+    """Runtime stand-in for reveal_type(), which checkers treat as a builtin."""
+    return obj
+
+
+def example_globals(name: str = "__main__") -> dict:
+    """
+    Fresh globals for exec'ing an example.
+    
+    Many examples call reveal_type() without importing it, which is fine for
+    the checkers but a NameError at runtime that would end execution early.
+    A silent stand-in lets the rest of the example run.
+    """
+    return {"__name__": name, "reveal_type": runtime_reveal_type}
+
+
 def execute_with_tracing(source_code: str) -> tuple[list[TypeBug], bool, str]:
     """
     Execute code and capture type-related exceptions.
@@ -380,7 +398,7 @@ def execute_with_tracing(source_code: str) -> tuple[list[TypeBug], bool, str]:
     try:
         with contextlib.redirect_stdout(stdout_capture), \
              contextlib.redirect_stderr(stdout_capture):
-            exec(compile(source_code, "<test>", "exec"), {"__name__": "__main__"})
+            exec(compile(source_code, "<test>", "exec"), example_globals())
         success = True
         
     except TypeError as e:
@@ -458,7 +476,7 @@ beartype_this_package()
     try:
         with contextlib.redirect_stdout(io.StringIO()), \
              contextlib.redirect_stderr(io.StringIO()):
-            exec(compile(instrumented, "<beartype_test>", "exec"), {"__name__": "__main__"})
+            exec(compile(instrumented, "<beartype_test>", "exec"), example_globals())
     except Exception as e:
         # Extract line number from traceback and correct for prepended lines
         tb = traceback.extract_tb(sys.exc_info()[2])
@@ -511,10 +529,15 @@ def run_hypothesis_tests(source_code: str, signatures: list[FunctionSignature])
     except ImportError:
         return bugs
     
+    # Example output is discarded: module-level prints run on exec, and any
+    # prints inside tested functions would repeat for every generated input
+    sink = io.StringIO()
+    
     # Compile the module to get access to functions
     try:
-        module_globals = {"__name__": "__test_module__"}
-        exec(compile(source_code, "<hypothesis_test>", "exec"), module_globals)
+        module_globals = example_globals("__test_module__")
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            exec(compile(source_code, "<hypothesis_test>", "exec"), module_globals)
     except Exception:
         # Can't even compile/run the module
         return bugs
@@ -560,10 +583,13 @@ def run_hypothesis_tests(source_code: str, signatures: list[FunctionSignature])
         test = make_test(func, strategies, sig.name, sig.line)
         
         try:
-            test()
+            with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                test()
         except Exception:
             # Test found a bug (already recorded in bugs list)
             pass
+        sink.seek(0)
+        sink.truncate()
     
     return bugs
 
@@ -595,12 +621,15 @@ def evaluate_example(
     runtime_bugs, execution_success, stdout = execute_with_tracing(source_code)
     all_bugs.extend(runtime_bugs)
     
+    # The static steps below share one parse of the source
+    tree = parse_source(source_code)
+    
     # Step 2: Find expected errors (try/except blocks)
-    expected_bugs = find_expected_errors(source_code)
+    expected_bugs = find_expected_errors(tree)
     all_bugs.extend(expected_bugs)
     
     # Step 3: Find unsafe NotRequired access
-    notrequired_bugs = find_notrequired_access(source_code)
+    notrequired_bugs = find_notrequired_access(source_code, tree)
     all_bugs.extend(notrequired_bugs)
     
     # Step 4: Run with beartype
@@ -608,7 +637,7 @@ def evaluate_example(
     all_bugs.extend(beartype_bugs)
     
     # Step 5: Extract signatures and run Hypothesis tests
-    signatures = extract_signatures(source_code)
+    signatures = extract_signatures(tree)
     functions_tested = [s.name for s in signatures if not s.is_method]
     
     hypothesis_bugs = run_hypothesis_tests(source_code, signatures)
@@ -791,8 +820,7 @@ def evaluate_results_testing(results_path: str) -> dict:
     
     total_bugs = sum(len(r.bugs_found) for r in all_results)
     proven_bugs = sum(
-        len([b for b in r.bugs_found if b.confidence >= 0.9])
-        for r in all_results
+        1 for r in all_results for b in r.bugs_found if b.confidence >= 0.9
     )
     
     print(f"\nTotal bugs detected: {total_bugs} ({proven_bugs} high-confidence)")
@@ -841,8 +869,6 @@ def evaluate_results_testing(results_path: str) -> dict:
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python testing_eval.py <results.json>")
         print()
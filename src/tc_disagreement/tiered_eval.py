@@ -51,6 +51,8 @@ from typing import Optional, Callable, Any
 from pathlib import Path
 from enum import Enum
 
+from testing_eval import NOTREQUIRED_KEY_PATTERN, example_globals
+
 
 class Verdict(Enum):
     CORRECT = "CORRECT"
@@ -58,7 +60,7 @@ class Verdict(Enum):
     UNCERTAIN = "UNCERTAIN"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeBug:
     """A confirmed type-related bug found through testing."""
     line: int
@@ -69,7 +71,7 @@ class TypeBug:
     details: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of tiered evaluation for a single file."""
     filename: str
@@ -98,7 +100,7 @@ def execute_with_tracing(source_code: str) -> tuple[list[TypeBug], bool, str]:
     try:
         with contextlib.redirect_stdout(stdout_capture), \
              contextlib.redirect_stderr(stdout_capture):
-            exec(compile(source_code, "<test>", "exec"), {"__name__": "__main__"})
+            exec(compile(source_code, "<test>", "exec"), example_globals())
         success = True
     except TypeError as e:
         tb = traceback.extract_tb(sys.exc_info()[2])
@@ -173,8 +175,11 @@ from beartype.roar import BeartypeCallHintException
 {ast.unparse(new_tree)}
 """
     
+    # Discard the example's own prints, as the other Level 1-3 runners do
     try:
-        exec(compile(wrapped_code, "<beartype_test>", "exec"), {"__name__": "__main__"})
+        with contextlib.redirect_stdout(io.StringIO()), \
+             contextlib.redirect_stderr(io.StringIO()):
+            exec(compile(wrapped_code, "<beartype_test>", "exec"), example_globals())
     except BeartypeCallHintException as e:
         bugs.append(TypeBug(
             line=0, bug_type="BeartypeViolation", message=str(e)[:300],
@@ -200,10 +205,7 @@ def analyze_ast_for_type_issues(source_code: str) -> list[TypeBug]:
         return bugs
     
     # Find NotRequired TypedDict keys
-    notrequired_keys = set()
-    import re
-    for match in re.finditer(r'(\w+)\s*:\s*NotRequired\[', source_code):
-        notrequired_keys.add(match.group(1))
+    notrequired_keys = set(NOTREQUIRED_KEY_PATTERN.findall(source_code))
     
     # Also check for total=False TypedDicts
     has_optional_typeddict = 'total=False' in source_code or notrequired_keys
@@ -379,6 +381,16 @@ class FunctionExtractor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+# Test inputs for plain annotations, built once at import time.
+BASIC_TYPE_INPUTS: dict[str, tuple[Any, ...]] = {
+    "int": (0, 1, -1, 2**31, -2**31),
+    "str": ("", "test", "a" * 100, "\n\t", "123"),
+    "float": (0.0, 1.5, -1.5, float('inf'), float('-inf')),
+    "bool": (True, False),
+    "None": (None,),
+}
+
+
 def generate_test_inputs_for_type(type_annotation: str) -> list[Any]:
     """Generate diverse test inputs based on type annotation."""
     inputs = []
@@ -389,16 +401,9 @@ def generate_test_inputs_for_type(type_annotation: str) -> list[Any]:
     ann = type_annotation.strip()
     
     # Basic types
-    if ann == "int":
-        inputs = [0, 1, -1, 2**31, -2**31]
-    elif ann == "str":
-        inputs = ["", "test", "a" * 100, "\n\t", "123"]
-    elif ann == "float":
-        inputs = [0.0, 1.5, -1.5, float('inf'), float('-inf')]
-    elif ann == "bool":
-        inputs = [True, False]
-    elif ann == "None":
-        inputs = [None]
+    basic = BASIC_TYPE_INPUTS.get(ann)
+    if basic is not None:
+        inputs = list(basic)
     elif ann.startswith("Optional["):
         inner = ann[9:-1]
         inputs = [None] + generate_test_inputs_for_type(inner)
@@ -599,7 +604,7 @@ def run_test_with_beartype(test_code: str, func_name: str) -> list[TypeBug]:
     try:
         with contextlib.redirect_stdout(stdout_capture), \
              contextlib.redirect_stderr(stdout_capture):
-            exec(compile(test_code, "<level2_test>", "exec"), {"__name__": "__main__"})
+            exec(compile(test_code, "<level2_test>", "exec"), example_globals())
     except (TypeError, KeyError, AttributeError) as e:
         bugs.append(TypeBug(
             line=0, bug_type=type(e).__name__, 
@@ -628,7 +633,7 @@ def run_test_with_beartype(test_code: str, func_name: str) -> list[TypeBug]:
 # LEVEL 3: Mutation Adequacy Testing
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Mutant:
     """A code mutant with type-relevant modifications."""
     name: str
@@ -638,6 +643,88 @@ class Mutant:
     original_line: int
 
 
+# Single-target transformers used to build each mutant. Defined once at module
+# level rather than re-created for every visited node.
+
+class StringReplacer(ast.NodeTransformer):
+    """Replace the first string constant with a given value on a line."""
+    
+    def __init__(self, target_line, target_value):
+        self.target_line = target_line
+        self.target_value = target_value
+        self.replaced = False
+
+    def visit_Constant(self, n):
+        if (n.lineno == self.target_line and 
+            n.value == self.target_value and 
+            not self.replaced):
+            self.replaced = True
+            return ast.Constant(value="__MUTANT_INVALID__")
+        return n
+
+
+class KeyRemover(ast.NodeTransformer):
+    """Remove one key from the dict literal on a line."""
+    
+    def __init__(self, target_line, target_key, idx):
+        self.target_line = target_line
+        self.target_key = target_key
+        self.idx = idx
+        self.removed = False
+
+    def visit_Dict(self, n):
+        if n.lineno == self.target_line and not self.removed:
+            if len(n.keys) > self.idx:
+                k = n.keys[self.idx]
+                if (isinstance(k, ast.Constant) and 
+                    k.value == self.target_key):
+                    self.removed = True
+                    new_keys = n.keys[:self.idx] + n.keys[self.idx+1:]
+                    new_vals = n.values[:self.idx] + n.values[self.idx+1:]
+                    return ast.Dict(keys=new_keys, values=new_vals)
+        return self.generic_visit(n)
+
+
+class ArgMutator(ast.NodeTransformer):
+    """Swap one constant call argument on a line for a value of the wrong type."""
+    
+    def __init__(self, target_line, arg_idx, original_val):
+        self.target_line = target_line
+        self.arg_idx = arg_idx
+        self.original_val = original_val
+        self.mutated = False
+
+    def visit_Call(self, n):
+        if n.lineno == self.target_line and not self.mutated:
+            if len(n.args) > self.arg_idx:
+                a = n.args[self.arg_idx]
+                if isinstance(a, ast.Constant) and a.value == self.original_val:
+                    self.mutated = True
+                    # Replace with wrong type
+                    if isinstance(self.original_val, str):
+                        new_val = 12345  # str -> int
+                    elif isinstance(self.original_val, int):
+                        new_val = "wrong_type"  # int -> str
+                    else:
+                        new_val = None
+                    n.args[self.arg_idx] = ast.Constant(value=new_val)
+        return self.generic_visit(n)
+
+
+class ReturnRemover(ast.NodeTransformer):
+    """Drop the return annotation of a named function."""
+    
+    def __init__(self, target_name):
+        self.target_name = target_name
+        self.removed = False
+
+    def visit_FunctionDef(self, n):
+        if n.name == self.target_name and not self.removed:
+            self.removed = True
+            n.returns = None
+        return self.generic_visit(n)
+
+
 class TypeAwareMutator:
     """Generate type-aware code mutations."""
     
@@ -678,22 +765,7 @@ class TypeAwareMutator:
             def visit_Constant(self, node):
                 if isinstance(node.value, str) and len(node.value) > 0:
                     # Mutate string literal
-                    mutated = copy.deepcopy(self.original)
-                    mutated_tree = ast.parse(mutated)
-                    
-                    class StringReplacer(ast.NodeTransformer):
-                        def __init__(self, target_line, target_value):
-                            self.target_line = target_line
-                            self.target_value = target_value
-                            self.replaced = False
-                        
-                        def visit_Constant(self, n):
-                            if (n.lineno == self.target_line and 
-                                n.value == self.target_value and 
-                                not self.replaced):
-                                self.replaced = True
-                                return ast.Constant(value="__MUTANT_INVALID__")
-                            return n
+                    mutated_tree = ast.parse(self.original)
                     
                     replacer = StringReplacer(node.lineno, node.value)
                     new_tree = replacer.visit(mutated_tree)
@@ -731,25 +803,6 @@ class TypeAwareMutator:
                             # Create mutant with this key removed
                             mutated_tree = ast.parse(self.original)
                             
-                            class KeyRemover(ast.NodeTransformer):
-                                def __init__(self, target_line, target_key, idx):
-                                    self.target_line = target_line
-                                    self.target_key = target_key
-                                    self.idx = idx
-                                    self.removed = False
-                                
-                                def visit_Dict(self, n):
-                                    if n.lineno == self.target_line and not self.removed:
-                                        if len(n.keys) > self.idx:
-                                            k = n.keys[self.idx]
-                                            if (isinstance(k, ast.Constant) and 
-                                                k.value == self.target_key):
-                                                self.removed = True
-                                                new_keys = n.keys[:self.idx] + n.keys[self.idx+1:]
-                                                new_vals = n.values[:self.idx] + n.values[self.idx+1:]
-                                                return ast.Dict(keys=new_keys, values=new_vals)
-                                    return self.generic_visit(n)
-                            
                             remover = KeyRemover(node.lineno, key.value, i)
                             new_tree = remover.visit(mutated_tree)
                             
@@ -790,29 +843,6 @@ class TypeAwareMutator:
                         # Create wrong-type mutant
                         mutated_tree = ast.parse(self.original)
                         
-                        class ArgMutator(ast.NodeTransformer):
-                            def __init__(self, target_line, arg_idx, original_val):
-                                self.target_line = target_line
-                                self.arg_idx = arg_idx
-                                self.original_val = original_val
-                                self.mutated = False
-                            
-                            def visit_Call(self, n):
-                                if n.lineno == self.target_line and not self.mutated:
-                                    if len(n.args) > self.arg_idx:
-                                        a = n.args[self.arg_idx]
-                                        if isinstance(a, ast.Constant) and a.value == self.original_val:
-                                            self.mutated = True
-                                            # Replace with wrong type
-                                            if isinstance(self.original_val, str):
-                                                new_val = 12345  # str -> int
-                                            elif isinstance(self.original_val, int):
-                                                new_val = "wrong_type"  # int -> str
-                                            else:
-                                                new_val = None
-                                            n.args[self.arg_idx] = ast.Constant(value=new_val)
-                                return self.generic_visit(n)
-                        
                         mutator = ArgMutator(node.lineno, i, arg.value)
                         new_tree = mutator.visit(mutated_tree)
                         
@@ -846,17 +876,6 @@ class TypeAwareMutator:
                 if node.returns:
                     mutated_tree = ast.parse(self.original)
                     
-                    class ReturnRemover(ast.NodeTransformer):
-                        def __init__(self, target_name):
-                            self.target_name = target_name
-                            self.removed = False
-                        
-                        def visit_FunctionDef(self, n):
-                            if n.name == self.target_name and not self.removed:
-                                self.removed = True
-                                n.returns = None
-                            return self.generic_visit(n)
-                    
                     remover = ReturnRemover(node.name)
                     new_tree = remover.visit(mutated_tree)
                     
@@ -916,7 +935,7 @@ from beartype.roar import BeartypeCallHintException
     try:
         with contextlib.redirect_stdout(stdout_capture), \
              contextlib.redirect_stderr(stdout_capture):
-            exec(compile(test_code, "<mutant>", "exec"), {"__name__": "__main__"})
+            exec(compile(test_code, "<mutant>", "exec"), example_globals())
         return False, None, "none"
     except (TypeError, KeyError, AttributeError) as e:
         return True, f"{type(e).__name__}: {str(e)[:100]}", "type_error"